@@ -10,10 +10,14 @@ outcomes.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import cached_property
+import importlib.util
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pathlib import Path
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
 # Abort immediately if a local stub shadows the real pandas. Only treat the
 # repository-level ``pandas/`` or ``src/pandas/`` directories as problematic;
@@ -29,6 +33,10 @@ if any(stub in pandas_path.parents for stub in local_stub_dirs):
         "Please remove any local 'pandas/' directories and reinstall dependencies."
     )
 
+# PyArrow is optional. When it is installed, CSV parsing goes through its
+# multi-threaded reader; otherwise pandas' own C parser is used.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 # Pre-define the expected schema. Categories are stored as ``object`` when
 # persisted to CSV so validation focuses on dtype *kinds* rather than exact
 # pandas extension types.
@@ -76,9 +84,12 @@ class SchemaConfig:
 
     required_columns: Dict[str, str]
 
-    @property
+    @cached_property
     def ordered_columns(self) -> List[str]:
-        """List of columns in a stable order for output files."""
+        """List of columns in a stable order for output files.
+
+        Computed on first access and cached on the instance.
+        """
         return list(self.required_columns.keys())
 
 
@@ -86,19 +97,138 @@ SCHEMA = SchemaConfig(required_columns=REQUIRED_COLUMNS)
 
 # Columns safe for modelling/evaluation that exclude any post-race observations.
 NON_LEAK_COLUMNS: List[str] = [col for col in SCHEMA.ordered_columns if not col.startswith(OBS_PREFIX)]
+REQUIRED_COLUMN_SET = frozenset(SCHEMA.required_columns)
+
+# Column groups used by the cleaning and validation steps. Built once at import
+# rather than on every call.
+NUMERIC_INT_COLUMNS: List[str] = [
+    "race_id",
+    "horse_id",
+    "n_runners",
+    "age",
+    "official_rating",
+    "draw",
+    "jockey_id",
+    "trainer_id",
+]
+NUMERIC_FLOAT_COLUMNS: List[str] = [
+    "race_distance",
+    "carried_weight",
+    "ltp_5min",
+]
+NUMERIC_DTYPES: Dict[str, str] = {
+    **dict.fromkeys(NUMERIC_INT_COLUMNS, "Int64"),
+    **dict.fromkeys(NUMERIC_FLOAT_COLUMNS, "float64"),
+}
+ESSENTIAL_COLUMNS: List[str] = [
+    "race_id",
+    "horse_id",
+    "date",
+    "race_time",
+    "n_runners",
+    "race_distance",
+]
+# Raw string columns parsed to timestamps by ``clean_fields``.
+DATETIME_COLUMNS: List[str] = ["date", "race_time"]
+# Fields that must take a single value across all runners of a race.
+RACE_CONSTANT_FIELDS: List[str] = ["date", "racecourse_name", "race_type_simple", "race_distance"]
+
+
+# Dtypes applied when reading the raw CSV. ``date`` and ``race_time`` stay as
+# strings so that ``clean_fields`` can parse them explicitly. Names and codes
+# repeat across many rows, so they are read as categoricals: each distinct
+# value is stored once and grouping/uniqueness checks work on integer codes.
+RAW_DTYPES: Dict[str, str] = {
+    "date": "string",
+    "racecourse_country": "category",
+    "racecourse_name": "category",
+    "race_time": "string",
+    "race_id": "Int64",
+    "race_distance": "float64",
+    "race_type": "category",
+    "race_type_simple": "category",
+    "going_clean": "category",
+    "n_runners": "Int64",
+    "horse_id": "Int64",
+    "horse_name": "category",
+    "age": "Int64",
+    "official_rating": "Int64",
+    "carried_weight": "float64",
+    "draw": "Int64",
+    "jockey_id": "Int64",
+    "jockey_name": "category",
+    "trainer_id": "Int64",
+    "trainer_name": "category",
+    "ltp_5min": "float64",
+    "obs__bsp": "float64",
+    "obs__racing_post_rating": "float64",
+    "obs__uposition": "Int64",
+    "obs__is_winner": "Int64",
+    "obs__top_speed": "float64",
+    "obs__distance_to_winner": "float64",
+    "obs__pos_prize": "float64",
+    "obs__completion_time": "float64",
+}
+
+# Arrow type aliases for each ``RAW_DTYPES`` entry, and the tokens pandas'
+# ``read_csv`` treats as missing by default; used by ``_read_csv_pyarrow`` so
+# both parsers produce the same frame.
+_ARROW_TYPE_ALIASES: Dict[str, str] = {
+    "string": "string",
+    "category": "string",
+    "Int64": "int64",
+    "float64": "float64",
+}
+_CSV_NULL_VALUES: List[str] = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Strings ``pd.to_datetime`` skips when inferring a format from the first value.
+_DATETIME_SKIP_STRINGS = frozenset({"", "NaT", "nat", "NAT", "nan", "NaN", "NAN", "now", "today"})
+
+# Rows per chunk for ``load_raw_chunks``; large enough to amortise per-chunk
+# overhead while keeping the working set to a fraction of a big file.
+RAW_CHUNK_SIZE = 250_000
+
+
+# Accepted dtype kinds and error wording for each expected type in the schema.
+# ``None`` marks string-like columns, which are matched on the dtype itself
+# (``string`` or categorical) since their kind is shared with plain ``object``.
+# Plain ``object`` columns pass every check. Resolved per column once at import
+# so ``validate_schema`` is a single kind comparison per column.
+_DTYPE_RULES: Dict[str, Tuple[Optional[str], str]] = {
+    "datetime": ("M", "datetime-like or string"),
+    "string": (None, "string-like"),
+    "object": (None, "string-like"),
+    "Int64": ("iu", "integer-like"),
+    "int": ("iu", "integer"),
+    "float": ("f", "float-like"),
+}
+_SCHEMA_DTYPE_RULES: Dict[str, Tuple[Optional[str], str]] = {
+    col: _DTYPE_RULES["datetime" if expected.startswith("datetime") else expected]
+    for col, expected in SCHEMA.required_columns.items()
+    if expected.startswith("datetime") or expected in _DTYPE_RULES
+}
 
 
 # ---------------------------------------------------------------------------
 # Loading and schema validation
 # ---------------------------------------------------------------------------
 
-def load_raw_data(path: str = "data/raw/test_dataset.csv") -> pd.DataFrame:
+def load_raw_data(
+    path: str = "data/raw/test_dataset.csv", include_observations: bool = True
+) -> pd.DataFrame:
     """Load the raw dataset from ``path`` and enforce basic dtypes.
 
     Parameters
     ----------
     path:
         CSV file location. Defaults to ``data/raw/test_dataset.csv``.
+    include_observations:
+        Whether to read the post-race ``obs__*`` columns. ``validate_schema``
+        requires them, but ``clean_fields`` discards them, so callers that skip
+        raw validation can pass ``False`` to leave them unparsed.
 
     Returns
     -------
@@ -108,42 +238,66 @@ def load_raw_data(path: str = "data/raw/test_dataset.csv") -> pd.DataFrame:
         cleaning.
     """
 
-    dtype_map = {
-        "date": "string",
-        "racecourse_country": "string",
-        "racecourse_name": "string",
-        "race_time": "string",
-        "race_id": "Int64",
-        "race_distance": "float64",
-        "race_type": "string",
-        "race_type_simple": "string",
-        "going_clean": "string",
-        "n_runners": "Int64",
-        "horse_id": "Int64",
-        "horse_name": "string",
-        "age": "Int64",
-        "official_rating": "Int64",
-        "carried_weight": "float64",
-        "draw": "Int64",
-        "jockey_id": "Int64",
-        "jockey_name": "string",
-        "trainer_id": "Int64",
-        "trainer_name": "string",
-        "ltp_5min": "float64",
-        "obs__bsp": "float64",
-        "obs__racing_post_rating": "float64",
-        "obs__uposition": "Int64",
-        "obs__is_winner": "Int64",
-        "obs__top_speed": "float64",
-        "obs__distance_to_winner": "float64",
-        "obs__pos_prize": "float64",
-        "obs__completion_time": "float64",
-    }
-
-    df = pd.read_csv(path, dtype=dtype_map)
+    usecols = None if include_observations else NON_LEAK_COLUMNS
+    if _HAS_PYARROW:
+        df = _read_csv_pyarrow(path, usecols)
+        if df is not None:
+            return df
+
+    df = pd.read_csv(path, dtype=RAW_DTYPES, usecols=usecols, float_precision="round_trip")
     return df
 
 
+def _read_csv_pyarrow(path: str, usecols: Optional[List[str]]) -> Optional[pd.DataFrame]:
+    """Read ``path`` with PyArrow's multi-threaded CSV reader.
+
+    Each ``RAW_DTYPES`` column is parsed straight to its Arrow type, with
+    ``read_csv``'s default missing-value tokens, and converted to the same
+    pandas dtypes as the C parser produces. Returns ``None`` when a value does
+    not convert (e.g. integers exported as ``1.0``) so the caller can fall
+    back to the C parser, which accepts them.
+    """
+
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    convert_options = pa_csv.ConvertOptions(
+        column_types={col: pa.type_for_alias(_ARROW_TYPE_ALIASES[dtype]) for col, dtype in RAW_DTYPES.items()},
+        include_columns=usecols or [],
+        null_values=_CSV_NULL_VALUES,
+        strings_can_be_null=True,
+    )
+    try:
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        return None
+    df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    text_dtypes = {col: dtype for col, dtype in RAW_DTYPES.items() if dtype in ("string", "category")}
+    return df.astype({col: dtype for col, dtype in text_dtypes.items() if col in df.columns})
+
+
+def load_raw_chunks(
+    path: str = "data/raw/test_dataset.csv",
+    chunksize: int = RAW_CHUNK_SIZE,
+    include_observations: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """Yield the raw dataset from ``path`` in chunks of ``chunksize`` rows.
+
+    Dtypes, float parsing, and ``include_observations`` match ``load_raw_data``
+    whichever parser it uses. Chunks keep a running index, so cleaning them one
+    at a time with ``clean_chunks`` bounds peak memory by the chunk size rather
+    than by the whole file.
+    """
+
+    usecols = None if include_observations else NON_LEAK_COLUMNS
+    # PyArrow has no chunked reader, so chunks always use the C parser.
+    reader = pd.read_csv(
+        path, dtype=RAW_DTYPES, usecols=usecols, chunksize=chunksize, float_precision="round_trip"
+    )
+    with reader:
+        yield from reader
+
+
 def validate_schema(df: pd.DataFrame) -> None:
     """Validate that required columns exist and have expected dtype kinds.
 
@@ -155,122 +309,197 @@ def validate_schema(df: pd.DataFrame) -> None:
     - no duplicate (race_id, horse_id) pairs
     """
 
-    missing = set(SCHEMA.required_columns) - set(df.columns)
+    missing = REQUIRED_COLUMN_SET.difference(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
-    for col, expected in SCHEMA.required_columns.items():
-        if col not in df.columns:
+    dtypes = df.dtypes
+    for col, (kinds, description) in _SCHEMA_DTYPE_RULES.items():
+        dtype = dtypes[col]
+        if isinstance(dtype, np.dtype) and dtype.kind == "O":
             continue
-        kind = df[col].dtype.kind
-        if expected.startswith("datetime"):
-            if not (
-                pd.api.types.is_datetime64_any_dtype(df[col])
-                or pd.api.types.is_object_dtype(df[col])
-            ):
-                raise ValueError(
-                    f"Column {col} must be datetime-like or string, found {df[col].dtype}"
-                )
-        elif expected in {"string", "object"}:
-            if not pd.api.types.is_object_dtype(df[col]) and df[col].dtype.name != "string":
-                raise ValueError(f"Column {col} must be string-like, found {df[col].dtype}")
-        elif expected == "Int64":
-            if not (
-                df[col].dtype == "Int64"
-                or pd.api.types.is_integer_dtype(df[col])
-                or pd.api.types.is_object_dtype(df[col])
-            ):
-                raise ValueError(f"Column {col} must be integer-like, found {df[col].dtype}")
-        elif expected == "int":
-            if not (pd.api.types.is_integer_dtype(df[col]) or pd.api.types.is_object_dtype(df[col])):
-                raise ValueError(f"Column {col} must be integer, found {df[col].dtype}")
-        elif expected == "float":
-            if not (pd.api.types.is_float_dtype(df[col]) or pd.api.types.is_object_dtype(df[col])):
-                raise ValueError(f"Column {col} must be float-like, found {df[col].dtype}")
-
-    if df.duplicated(subset=["race_id", "horse_id"]).any():
+        if kinds is None:
+            valid = dtype.name == "string" or isinstance(dtype, pd.CategoricalDtype)
+        else:
+            valid = dtype.kind in kinds
+        if not valid:
+            raise ValueError(f"Column {col} must be {description}, found {dtype}")
+
+    if _has_duplicate_runner_keys(df):
         raise ValueError("Duplicate (race_id, horse_id) pairs detected")
 
 
+def _has_duplicate_runner_keys(df: pd.DataFrame) -> bool:
+    """Return ``True`` if any ``(race_id, horse_id)`` pair occurs more than once.
+
+    When both identifiers are complete integer columns the pair is packed into
+    a single ``int64`` key and its distinct values are counted with
+    ``pd.unique``: one hash-table pass, with no sort and no per-row boolean
+    result. Missing values, non-integer columns, or id ranges too wide
+    to pack fall back to ``DataFrame.duplicated``.
+    """
+
+    race_ids = df["race_id"]
+    horse_ids = df["horse_id"]
+    if (
+        len(df)
+        and pd.api.types.is_integer_dtype(race_ids.dtype)
+        and pd.api.types.is_integer_dtype(horse_ids.dtype)
+        and not (race_ids.hasnans or horse_ids.hasnans)
+    ):
+        race_arr = race_ids.to_numpy(dtype="int64")
+        horse_arr = horse_ids.to_numpy(dtype="int64")
+        race_min, horse_min = race_arr.min(), horse_arr.min()
+        # Ranges are computed as Python ints: the offsets below only stay
+        # within ``int64`` when the packed key space fits.
+        race_range = int(race_arr.max()) - int(race_min)
+        span = int(horse_arr.max()) - int(horse_min) + 1
+        if race_range < np.iinfo(np.int64).max // span:
+            keys = (race_arr - race_min) * span + (horse_arr - horse_min)
+            return len(pd.unique(keys)) != len(keys)
+    return bool(df.duplicated(subset=["race_id", "horse_id"]).any())
+
+
 # ---------------------------------------------------------------------------
 # Cleaning helpers
 # ---------------------------------------------------------------------------
 
-def _safe_numeric(series: pd.Series, dtype: str) -> pd.Series:
-    """Convert a series to numeric with safe coercion and the requested dtype."""
+def _safe_numeric(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Convert the columns in ``dtypes`` to numeric with safe coercion.
+
+    Returns a frame of just those columns with the requested dtypes. Columns
+    that are already integer or float skip parsing; any others go through one
+    ``DataFrame.apply(pd.to_numeric)`` call (still one ``to_numeric`` per
+    column), and the dtype casts are applied in one ``astype`` call for the
+    columns that need one.
+    """
+
+    block = df[list(dtypes)]
+    to_parse = [col for col, dtype in block.dtypes.items() if dtype.kind not in "iuf"]
+    if to_parse:
+        parsed = block[to_parse].apply(pd.to_numeric, errors="coerce")
+        block = block.assign(**{col: parsed[col] for col in to_parse})
+    # Columns typed by ``load_raw_data`` already have the target dtype; casting
+    # them would only duplicate the buffers.
+    casts = {col: dtype for col, dtype in dtypes.items() if block[col].dtype != dtype}
+    if casts:
+        block = block.astype(casts)
+    return block
+
+
+def _positive_mask(series: pd.Series) -> np.ndarray:
+    """Return a NumPy boolean mask of strictly positive values.
+
+    Nullable extension arrays are compared on a plain ``float64`` view with
+    missing values mapped to ``NaN`` so the comparison is a single NumPy
+    kernel rather than a masked, NA-propagating ``BooleanArray``. Missing
+    values therefore compare as ``False``, matching boolean indexing with NA.
+    """
 
-    coerced = pd.to_numeric(series, errors="coerce")
-    if dtype == "Int64":
-        return coerced.astype("Int64")
-    return coerced.astype(dtype)
+    return series.to_numpy(dtype="float64", na_value=np.nan) > 0
 
 
-def clean_fields(df: pd.DataFrame) -> pd.DataFrame:
+def clean_fields(df: pd.DataFrame, datetime_formats: Optional[Dict[str, str]] = None) -> pd.DataFrame:
     """Clean and normalise the raw dataframe.
 
     Steps include:
     - parsing dates and times
     - coercing numeric fields (age, draw, weight, distance)
     - removing or flagging corrupted rows
-    - standardising finish positions and dropping ``obs__*`` columns
+    - dropping ``obs__*`` columns
+
+    ``datetime_formats`` optionally fixes the ``pd.to_datetime`` format per
+    column; by default it is inferred from each column's first value.
     """
 
-    df = df.copy()
-
-    # Parse date and time
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df["race_time"] = pd.to_datetime(df["race_time"], errors="coerce")
-
-    # Numeric conversions
-    numeric_int = ["race_id", "horse_id", "n_runners", "age", "official_rating", "draw", "jockey_id", "trainer_id"]
-    for col in numeric_int:
-        df[col] = _safe_numeric(df[col], "Int64")
-
-    numeric_float = [
-        "race_distance",
-        "carried_weight",
-        "ltp_5min",
-        "obs__bsp",
-        "obs__racing_post_rating",
-        "obs__top_speed",
-        "obs__distance_to_winner",
-        "obs__pos_prize",
-        "obs__completion_time",
-    ]
-    for col in numeric_float:
-        df[col] = _safe_numeric(df[col], "float64")
-
-    # Post-race observation of finishing position
-    df["obs__uposition"] = _safe_numeric(df["obs__uposition"], "Int64")
-    df["obs__is_winner"] = _safe_numeric(df["obs__is_winner"], "Int64")
-
-    # Remove rows with clearly invalid identifiers or missing essentials
-    essential_cols = [
-        "race_id",
-        "horse_id",
-        "date",
-        "race_time",
-        "n_runners",
-        "race_distance",
-    ]
-    df = df.dropna(subset=essential_cols)
-
-    # Drop impossible or invalid values
-    df = df[df["race_distance"] > 0]
-    df = df[df["n_runners"] > 0]
-    if "age" in df:
-        df = df[df["age"] > 0]
-
-    df = df.dropna(subset=["race_id", "horse_id"])
-
-    non_leak_columns = [col for col in SCHEMA.ordered_columns if not col.startswith(OBS_PREFIX)]
-    for col in non_leak_columns:
-        if col not in df.columns:
-            df[col] = pd.NA
-
-    # Ensure ordering of columns for deterministic output and remove obs__* fields
-    cleaned = df[non_leak_columns]
-    return cleaned
+    # Only pre-race columns survive cleaning, so build just those, in output
+    # order, straight from the raw frame. This needs no copy of the input and
+    # skips coercing ``obs__*`` fields that would be dropped anyway. Columns
+    # absent from the raw data are filled with ``pd.NA``.
+    numeric = _safe_numeric(df, NUMERIC_DTYPES)
+    formats = datetime_formats or {}
+    out: Dict[str, pd.Series] = {}
+    for col in NON_LEAK_COLUMNS:
+        if col in DATETIME_COLUMNS:
+            out[col] = pd.to_datetime(df[col], errors="coerce", format=formats.get(col))
+        elif col in numeric.columns:
+            out[col] = numeric[col]
+        else:
+            out[col] = df[col] if col in df.columns else pd.NA
+
+    # Remove rows with clearly invalid identifiers or missing essentials.
+    # Per-column masks avoid building an intermediate boolean sub-frame.
+    masks = [out[col].notna().to_numpy() for col in ESSENTIAL_COLUMNS]
+
+    # Drop impossible or invalid values as well. All filters are combined into
+    # one mask so the frame is materialised once instead of once per condition.
+    masks.append(_positive_mask(out["race_distance"]))
+    masks.append(_positive_mask(out["n_runners"]))
+    masks.append(_positive_mask(out["age"]))
+
+    # ``copy=False`` (and returning this frame as is below) shares column
+    # buffers with ``df``; copy-on-write, the default from pandas 3, keeps the
+    # two independent once either is modified.
+    cleaned = pd.DataFrame(out, index=df.index, copy=False)
+    keep = np.logical_and.reduce(masks)
+    if keep.all():
+        # Nothing to drop: skip the row take and its copy of every column.
+        return cleaned
+    return cleaned[keep]
+
+
+def clean_chunks(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Clean raw ``chunks`` one at a time and concatenate the results once.
+
+    Every cleaning step works row by row, and the date/time formats inferred
+    from the first chunk that has values are reused for the rest, so the result
+    is the same as running ``clean_fields`` on the concatenated raw data while
+    only one raw chunk is held in memory at a time. Checks that need the whole
+    dataset (raw schema and duplicate runner keys, race invariants) must still
+    run on the combined data, which is why ``__main__`` keeps the whole-file
+    path; this one suits callers that skip raw validation.
+    """
+
+    formats: Dict[str, str] = {}
+    parts = []
+    for chunk in chunks:
+        for col in DATETIME_COLUMNS:
+            if col not in formats and col in chunk.columns:
+                fmt = _infer_datetime_format(chunk[col])
+                if fmt is not None:
+                    formats[col] = fmt
+        parts.append(clean_fields(chunk, datetime_formats=formats))
+
+    # Each chunk infers its own categories and ``concat`` falls back to full
+    # string columns when they differ, so recode every chunk to one shared
+    # dtype first; the single ``concat`` then keeps the integer codes. Chunks
+    # where a column is entirely missing have no categories (of an unrelated
+    # dtype) and contribute nothing to it.
+    shared: Dict[str, pd.CategoricalDtype] = {}
+    for col, dtype in parts[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = [part[col].cat.categories for part in parts if len(part[col].cat.categories)]
+            if categories:
+                shared[col] = pd.CategoricalDtype(categories[0].append(categories[1:]).unique().sort_values())
+    if shared:
+        parts = [part.astype(shared) for part in parts]
+    return pd.concat(parts)
+
+
+def _infer_datetime_format(series: pd.Series) -> Optional[str]:
+    """Return the format ``pd.to_datetime`` would infer for ``series``.
+
+    Like pandas, the format is guessed from the first non-missing value;
+    ``"mixed"`` (per-element parsing) is returned when that value is not a
+    string or has no recognisable format, and ``None`` when there is no value.
+    """
+
+    for value in series.dropna():
+        if not isinstance(value, str):
+            return "mixed"
+        if value not in _DATETIME_SKIP_STRINGS:
+            return guess_datetime_format(value) or "mixed"
+    return None
 
 
 def validate_race_invariants(df: pd.DataFrame) -> None:
@@ -280,42 +509,134 @@ def validate_race_invariants(df: pd.DataFrame) -> None:
     - date, racecourse_name, race_type_simple, and race_distance are constant
     - number of rows equals ``n_runners``
     - observed finishing positions are within ``[1, n_runners]`` or missing for non-finishers
-    """
 
-    grouped = df.groupby("race_id")
-    for race_id, group in grouped:
-        for field in ["date", "racecourse_name", "race_type_simple", "race_distance"]:
-            if group[field].nunique(dropna=True) > 1:
-                raise ValueError(f"Race {race_id} has inconsistent {field}")
+    Rows are ordered by ``race_id`` once so each race occupies a contiguous
+    segment, and every invariant is evaluated for all races at once with
+    ``ufunc.reduceat``. Races are reported in ``race_id`` order, first failing
+    check first, exactly as a per-group loop would.
+    """
 
-        expected = group["n_runners"].iloc[0]
-        if len(group) != expected:
-            raise ValueError(f"Race {race_id} expected {expected} runners but found {len(group)}")
+    rows, starts, race_values = _race_segments(df["race_id"])
+    if not len(starts):
+        return
+
+    first_rows = rows[starts]
+    sizes = np.diff(np.append(starts, len(rows)))
+    expected = df["n_runners"].to_numpy(dtype="float64", na_value=np.nan)[first_rows]
+
+    checks = []
+    for field in RACE_CONSTANT_FIELDS:
+        # Factorised codes compare any dtype as integers; ``-1`` marks missing
+        # values, which are ignored just like ``nunique(dropna=True)`` does.
+        codes = pd.factorize(df[field])[0][rows]
+        lowest = np.minimum.reduceat(np.where(codes < 0, np.iinfo(codes.dtype).max, codes), starts)
+        highest = np.maximum.reduceat(codes, starts)
+        checks.append((highest >= 0) & (lowest < highest))
+
+    checks.append(sizes != expected)
+
+    if "obs__uposition" in df.columns:
+        finish = np.trunc(df["obs__uposition"].to_numpy(dtype="float64", na_value=np.nan))[rows]
+        # ``fmin``/``fmax`` skip NaN, so races without finishers yield NaN and
+        # never compare as out of range.
+        lowest = np.fmin.reduceat(finish, starts)
+        highest = np.fmax.reduceat(finish, starts)
+        checks.append((lowest < 1) | (highest > expected))
+
+    failures = np.column_stack(checks)
+    failed_races = np.flatnonzero(failures.any(axis=1))
+    if not len(failed_races):
+        return
+
+    race = failed_races[0]
+    race_id = race_values[race]
+    check = int(np.argmax(failures[race]))
+    if check < len(RACE_CONSTANT_FIELDS):
+        raise ValueError(f"Race {race_id} has inconsistent {RACE_CONSTANT_FIELDS[check]}")
+    if check == len(RACE_CONSTANT_FIELDS):
+        runners = df["n_runners"].iloc[first_rows[race]]
+        raise ValueError(f"Race {race_id} expected {runners} runners but found {sizes[race]}")
+    raise ValueError(f"Race {race_id} has invalid finish positions")
+
+
+def _race_segments(race_ids: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Group row positions into contiguous per-race segments.
+
+    Returns the positions of all rows with a known ``race_id`` ordered by race
+    (stable, so each segment keeps the original row order), the start offset of
+    each segment within that ordering, and the sorted race ids themselves.
+    """
 
-        finish_vals = group.get("obs__uposition")
-        if finish_vals is None:
-            continue
-        finish_vals = finish_vals.dropna().astype(int)
-        if not finish_vals.empty:
-            if finish_vals.min() < 1 or finish_vals.max() > expected:
-                raise ValueError(f"Race {race_id} has invalid finish positions")
+    codes, race_values = pd.factorize(race_ids, sort=True)
+    rows = np.flatnonzero(codes >= 0)
+    ordered = codes[rows]
+    # Input already grouped in ascending ``race_id`` order (e.g. from a sorted
+    # export) needs no reordering at all, so skip the argsort in that case.
+    if np.any(ordered[1:] < ordered[:-1]):
+        rows = rows[np.argsort(ordered, kind="stable")]
+        ordered = codes[rows]
+    starts = np.flatnonzero(np.diff(ordered, prepend=-1))
+    return rows, starts, race_values
 
 
 def enforce_chronological_order(df: pd.DataFrame) -> pd.DataFrame:
     """Sort races by date, race_time, and race_id to ensure temporal order."""
 
-    ordered = df.sort_values(by=["date", "race_time", "race_id"], kind="mergesort")
+    by = ["date", "race_time", "race_id"]
+    arrays = [_sort_key_array(df[col]) for col in by]
+    if all(array is not None for array in arrays):
+        # ``np.lexsort`` is stable and treats the *last* key as the primary one.
+        order = np.lexsort(arrays[::-1])
+        return df.take(order).reset_index(drop=True)
+
+    ordered = df.sort_values(by=by, kind="mergesort")
     ordered = ordered.reset_index(drop=True)
     return ordered
 
 
-def save_cleaned_data(df: pd.DataFrame, path: str = "data/processed/clean.csv") -> None:
-    """Persist the cleaned dataset to ``path``."""
+def _sort_key_array(series: pd.Series) -> Optional[np.ndarray]:
+    """Return ``series`` as a raw ndarray suitable for ``np.lexsort``.
+
+    Numeric and naive datetime columns qualify, including nullable extension
+    types such as ``Int64`` (unwrapped to their NumPy dtype). Columns with
+    missing values or any other dtype return ``None`` so the caller keeps
+    pandas' own NA placement via ``sort_values``.
+    """
+
+    numpy_dtype = getattr(series.dtype, "numpy_dtype", series.dtype)
+    if not isinstance(numpy_dtype, np.dtype) or numpy_dtype.kind not in "iufM":
+        return None
+    if series.hasnans:
+        return None
+    return series.to_numpy(dtype=numpy_dtype)
+
+
+def save_cleaned_data(df: pd.DataFrame, path: str = "data/processed/clean.csv", parquet: bool = False) -> None:
+    """Persist the cleaned dataset to ``path``.
+
+    With ``parquet=True`` a Parquet copy (same stem, ``.parquet`` suffix) is
+    also written, which keeps dtypes exactly and reloads faster than the CSV.
+    It needs PyArrow; if it cannot be written a ``ValueError`` is raised after
+    the CSV has been saved and no partial Parquet file is left behind.
+    """
 
     path_obj = Path(path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
-    df = df[[col for col in NON_LEAK_COLUMNS if col in df.columns]]
-    df.to_csv(path_obj, index=False)
+    # Let the writer pick the columns while serialising rather than building an
+    # intermediate frame with a copy of every selected column first.
+    columns = [col for col in NON_LEAK_COLUMNS if col in df.columns]
+    df.to_csv(path_obj, index=False, columns=columns)
+    if not parquet:
+        return
+
+    parquet_path = path_obj.with_suffix(".parquet")
+    # Parquet has no column selection on write; only subset when needed.
+    frame = df if columns == list(df.columns) else df[columns]
+    try:
+        frame.to_parquet(parquet_path, index=False)
+    except (ImportError, TypeError, ValueError) as exc:
+        parquet_path.unlink(missing_ok=True)
+        raise ValueError(f"Saved {path_obj} but could not write {parquet_path}: {exc}") from exc
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+CLEAN_CSV = Path("data/processed/clean.csv")
+
+
+def _load_cleaned():
+    df = pd.read_csv(CLEAN_CSV, parse_dates=["date", "race_time"])
+    # Coerce types to expected pandas representations
+    df["race_id"] = pd.to_numeric(df["race_id"], errors="coerce").astype("Int64")
+    df["horse_id"] = pd.to_numeric(df["horse_id"], errors="coerce").astype("Int64")
+    df["n_runners"] = pd.to_numeric(df["n_runners"], errors="coerce").astype("Int64")
+    df["draw"] = pd.to_numeric(df["draw"], errors="coerce")
+    df["age"] = pd.to_numeric(df["age"], errors="coerce")
+    df["race_distance"] = pd.to_numeric(df["race_distance"], errors="coerce")
+    df["carried_weight"] = pd.to_numeric(df["carried_weight"], errors="coerce")
+    df["official_rating"] = pd.to_numeric(df["official_rating"], errors="coerce")
+    return df
+
+
+@pytest.fixture(scope="session")
+def cleaned_df():
+    """Cleaned dataset shared by every test module; loaded once per session."""
+    return _load_cleaned()
@@ -1,47 +1,81 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from src import cleaning
 
 
-@pytest.fixture(scope="module")
-def cleaned_df():
-    df = pd.read_csv("data/processed/clean.csv", parse_dates=["date", "race_time"])
-    df["race_id"] = pd.to_numeric(df["race_id"], errors="coerce").astype("Int64")
-    df["horse_id"] = pd.to_numeric(df["horse_id"], errors="coerce").astype("Int64")
-    df["n_runners"] = pd.to_numeric(df["n_runners"], errors="coerce").astype("Int64")
-    df["race_distance"] = pd.to_numeric(df["race_distance"], errors="coerce")
-    df["age"] = pd.to_numeric(df["age"], errors="coerce")
-    df["draw"] = pd.to_numeric(df["draw"], errors="coerce")
-    df["carried_weight"] = pd.to_numeric(df["carried_weight"], errors="coerce")
-    return df
-
-
 def test_race_level_invariants(cleaned_df):
-    grouped = cleaned_df.groupby("race_id")
-    for race_id, group in grouped:
-        assert group["date"].nunique(dropna=True) == 1, f"Date mismatch in race {race_id}"
-        assert (
-            group["racecourse_name"].nunique(dropna=True) == 1
-        ), f"Racecourse mismatch in race {race_id}"
-        assert group["race_type_simple"].nunique(dropna=True) == 1, f"Type mismatch in race {race_id}"
-        assert group["race_distance"].nunique(dropna=True) == 1, f"Distance mismatch in race {race_id}"
+    labels = {
+        "date": "Date",
+        "racecourse_name": "Racecourse",
+        "race_type_simple": "Type",
+        "race_distance": "Distance",
+    }
+    nunique = cleaned_df.groupby("race_id")[list(labels)].nunique(dropna=True)
+    for field, label in labels.items():
+        bad_races = nunique.index[nunique[field] != 1].tolist()
+        assert not bad_races, f"{label} mismatch in races {bad_races[:10]}"
 
 
 def test_runner_count_matches(cleaned_df):
     grouped = cleaned_df.groupby("race_id")
-    for race_id, group in grouped:
-        expected = int(group["n_runners"].iloc[0])
-        assert len(group) == expected, f"Race {race_id} expected {expected} runners"
+    sizes = grouped.size()
+    expected = grouped["n_runners"].first()
+    mismatched = sizes.ne(expected).fillna(True)
+    bad_races = sizes.index[mismatched.to_numpy(dtype=bool)].tolist()
+    assert not bad_races, f"Races with unexpected runner counts: {bad_races[:10]}"
 
 
 def test_numeric_fields_positive(cleaned_df):
-    numeric_positive = ["race_distance", "age", "carried_weight", "draw"]
-    for col in numeric_positive:
-        assert (cleaned_df[col] > 0).all(), f"Non-positive values found in {col}"
-    assert (cleaned_df["n_runners"] > 0).all(), "n_runners must be positive"
+    numeric_positive = ["race_distance", "age", "carried_weight", "draw", "n_runners"]
+    block = cleaned_df[numeric_positive].to_numpy(dtype="float64", na_value=np.nan)
+    # Column minima avoid a boolean mask per column; NaN propagates and fails.
+    minima = np.min(block, axis=0, initial=np.inf)
+    bad = [col for col, lowest in zip(numeric_positive, minima) if not lowest > 0]
+    assert not bad, f"Non-positive values found in {bad}"
 
 
 def test_chronological_order(cleaned_df):
     ordered = cleaning.enforce_chronological_order(cleaned_df)
     pd.testing.assert_frame_equal(ordered, cleaned_df.reset_index(drop=True))
+
+
+def test_chronological_order_matches_stable_sort():
+    dates = pd.to_datetime(["2020-01-02", "2020-01-01", "2020-01-01", "2020-01-02", "2020-01-01"])
+    times = pd.to_datetime(
+        ["2020-01-02 14:00", "2020-01-01 15:00", "2020-01-01 14:00", "2020-01-02 14:00", "2020-01-01 15:00"]
+    )
+    for race_dtype in ("int64", "Int64"):
+        df = pd.DataFrame(
+            {
+                "date": dates,
+                "race_time": times,
+                "race_id": pd.array([7, 5, 3, 6, 5], dtype=race_dtype),
+                "horse_id": [1, 2, 3, 4, 5],
+            }
+        )
+        expected = df.sort_values(["date", "race_time", "race_id"], kind="mergesort").reset_index(drop=True)
+        pd.testing.assert_frame_equal(cleaning.enforce_chronological_order(df), expected)
+
+
+def test_validate_race_invariants_reports_first_bad_race():
+    df = pd.DataFrame(
+        {
+            "race_id": pd.array([2, 1, 2, 1, 3], dtype="Int64"),
+            "date": pd.to_datetime(["2020-01-01"] * 5),
+            "racecourse_name": ["A", "A", "A", "A", "B"],
+            "race_type_simple": ["Flat"] * 5,
+            "race_distance": [1000.0, 1200.0, 1000.0, 1200.0, 1600.0],
+            "n_runners": pd.array([2, 2, 2, 2, 1], dtype="Int64"),
+            "obs__uposition": pd.array([1, 2, 2, None, 1], dtype="Int64"),
+        }
+    )
+    cleaning.validate_race_invariants(df)
+
+    with pytest.raises(ValueError, match="Race 1 has inconsistent racecourse_name"):
+        cleaning.validate_race_invariants(df.assign(racecourse_name=["A", "B", "A", "C", "B"]))
+    with pytest.raises(ValueError, match="Race 3 expected 2 runners but found 1"):
+        cleaning.validate_race_invariants(df.assign(n_runners=pd.array([2, 2, 2, 2, 2], dtype="Int64")))
+    with pytest.raises(ValueError, match="Race 2 has invalid finish positions"):
+        cleaning.validate_race_invariants(df.assign(obs__uposition=pd.array([1, 2, 3, None, 1], dtype="Int64")))
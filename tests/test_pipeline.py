@@ -1,6 +1,42 @@
 import pandas as pd
 import pytest
 
+from src import cleaning
+
+
+def _write_raw_csv(path, n_races=2, runners=3, **overrides):
+    """Write a small, valid raw CSV to ``path``; ``overrides`` replace whole columns."""
+    n_rows = n_races * runners
+    rows = {
+        "date": ["2020-07-25"] * n_rows,
+        "racecourse_country": ["GB"] * n_rows,
+        "racecourse_name": ["York"] * n_rows,
+        "race_time": [f"2020-07-25 {14 + i // runners}:00:00" for i in range(n_rows)],
+        "race_id": [1000 + i // runners for i in range(n_rows)],
+        "race_distance": [2400.0] * n_rows,
+        "race_type": ["Hurdle X"] * n_rows,
+        "race_type_simple": ["Hurdle"] * n_rows,
+        "going_clean": ["Good"] * n_rows,
+        "n_runners": [runners] * n_rows,
+        "horse_id": [1 + i for i in range(n_rows)],
+        "horse_name": [f"H{1 + i}" for i in range(n_rows)],
+        "age": [5] * n_rows,
+        "official_rating": [110] * n_rows,
+        "carried_weight": [130.1] * n_rows,
+        "draw": [1 + i % runners for i in range(n_rows)],
+        "jockey_id": [9] * n_rows,
+        "jockey_name": ["J9"] * n_rows,
+        "trainer_id": [4] * n_rows,
+        "trainer_name": ["T4"] * n_rows,
+        "ltp_5min": [40.27] * n_rows,
+    }
+    for col in cleaning.REQUIRED_COLUMNS:
+        if col.startswith(cleaning.OBS_PREFIX):
+            rows[col] = [1 + i % runners for i in range(n_rows)]
+    rows.update(overrides)
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
 
 def test_import_cleaning_module():
     import src.cleaning  # noqa: F401
@@ -53,3 +89,100 @@ def test_cleaned_data_basic_properties(cleaned_temp_path):
         if non_na.empty:
             continue
         assert (non_na > 0).all(), f"Column {col} contains non-positive values"
+
+
+def test_chunked_cleaning_matches_full_frame(tmp_path):
+    path = str(_write_raw_csv(tmp_path / "raw.csv", n_races=4, carried_weight=[130.18747423269562] * 12))
+
+    expected = cleaning.clean_fields(cleaning.load_raw_data(path))
+    chunked = cleaning.clean_chunks(cleaning.load_raw_chunks(path, chunksize=5, include_observations=False))
+    pd.testing.assert_frame_equal(chunked, expected, check_exact=True)
+
+
+def test_chunked_cleaning_reuses_first_chunk_date_format(tmp_path):
+    path = str(_write_raw_csv(tmp_path / "raw.csv", date=["2020-07-25"] * 3 + ["26/07/2020"] * 3))
+
+    expected = cleaning.clean_fields(cleaning.load_raw_data(path))
+    chunked = cleaning.clean_chunks(cleaning.load_raw_chunks(path, chunksize=3))
+
+    assert len(expected) == 3
+    pd.testing.assert_frame_equal(chunked, expected, check_exact=True)
+
+
+def test_load_raw_data_keeps_string_columns_verbatim(tmp_path):
+    path = _write_raw_csv(
+        tmp_path / "raw.csv",
+        n_races=1,
+        runners=2,
+        horse_name=["007", "12"],
+        going_clean=["1.50", "Good"],
+        race_time=["2020-01-01T14:00:00", "15:30"],
+    )
+
+    raw = cleaning.load_raw_data(str(path))
+
+    assert list(raw["horse_name"]) == ["007", "12"]
+    assert list(raw["going_clean"]) == ["1.50", "Good"]
+    assert list(raw["race_time"]) == ["2020-01-01T14:00:00", "15:30"]
+    assert list(raw["horse_name"].cat.categories) == ["007", "12"]
+    cleaning.validate_schema(raw)
+
+
+def test_load_raw_data_accepts_float_formatted_integers(tmp_path):
+    # pandas writes nullable integer columns as floats, e.g. finish positions
+    # with non-finishers missing.
+    path = _write_raw_csv(tmp_path / "raw.csv", n_races=1, runners=3, obs__uposition=[1.0, 2.0, None])
+
+    raw = cleaning.load_raw_data(str(path))
+
+    assert raw["obs__uposition"].dtype == "Int64"
+    assert raw["obs__uposition"].tolist() == [1, 2, pd.NA]
+    expected = pd.read_csv(path, dtype=cleaning.RAW_DTYPES, float_precision="round_trip")
+    pd.testing.assert_frame_equal(raw, expected, check_exact=True)
+
+
+def test_chunked_cleaning_handles_all_missing_categorical_chunk(tmp_path):
+    path = _write_raw_csv(tmp_path / "raw.csv", going_clean=[None] * 3 + ["Good", "Soft", "Good"])
+
+    expected = cleaning.clean_fields(cleaning.load_raw_data(str(path)))
+    chunked = cleaning.clean_chunks(cleaning.load_raw_chunks(str(path), chunksize=3))
+
+    assert isinstance(chunked["going_clean"].dtype, pd.CategoricalDtype)
+    assert isinstance(chunked["horse_name"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(chunked, expected, check_exact=True)
+
+
+def test_save_cleaned_data_writes_parquet_copy_on_request(tmp_path):
+    pytest.importorskip("pyarrow")
+    raw_path = _write_raw_csv(tmp_path / "raw.csv")
+    ordered = cleaning.enforce_chronological_order(cleaning.clean_fields(cleaning.load_raw_data(str(raw_path))))
+
+    cleaning.save_cleaned_data(ordered, path=str(tmp_path / "plain.csv"))
+    assert not (tmp_path / "plain.parquet").exists(), "Parquet copy should be opt-in"
+
+    cleaning.save_cleaned_data(ordered, path=str(tmp_path / "clean.csv"), parquet=True)
+    parquet_path = tmp_path / "clean.parquet"
+    assert parquet_path.exists(), "Parquet copy was not written"
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), ordered, check_exact=True)
+
+
+def test_save_cleaned_data_reports_parquet_failure(tmp_path):
+    pytest.importorskip("pyarrow")
+    mixed = pd.DataFrame({"horse_name": pd.Series(["H1", 2], dtype=object), "age": [5, 6]})
+
+    with pytest.raises(ValueError, match="could not write"):
+        cleaning.save_cleaned_data(mixed, path=str(tmp_path / "clean.csv"), parquet=True)
+
+    assert (tmp_path / "clean.csv").exists()
+    assert not (tmp_path / "clean.parquet").exists()
+
+
+def test_clean_fields_output_is_independent_of_raw_frame(tmp_path):
+    raw = cleaning.load_raw_data(str(_write_raw_csv(tmp_path / "raw.csv")))
+    raw_before = raw.copy()
+
+    cleaned = cleaning.clean_fields(raw)
+    cleaned.loc[cleaned.index[0], "age"] = 99
+    cleaned.loc[cleaned.index[0], "horse_name"] = "H2"
+
+    pd.testing.assert_frame_equal(raw, raw_before)
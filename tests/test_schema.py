@@ -4,22 +4,6 @@ import pytest
 from src import cleaning
 
 
-@pytest.fixture(scope="module")
-def cleaned_df():
-    path = "data/processed/clean.csv"
-    df = pd.read_csv(path, parse_dates=["date", "race_time"])
-    # Coerce types to expected pandas representations
-    df["race_id"] = pd.to_numeric(df["race_id"], errors="coerce").astype("Int64")
-    df["horse_id"] = pd.to_numeric(df["horse_id"], errors="coerce").astype("Int64")
-    df["n_runners"] = pd.to_numeric(df["n_runners"], errors="coerce").astype("Int64")
-    df["draw"] = pd.to_numeric(df["draw"], errors="coerce")
-    df["age"] = pd.to_numeric(df["age"], errors="coerce")
-    df["race_distance"] = pd.to_numeric(df["race_distance"], errors="coerce")
-    df["carried_weight"] = pd.to_numeric(df["carried_weight"], errors="coerce")
-    df["official_rating"] = pd.to_numeric(df["official_rating"], errors="coerce")
-    return df
-
-
 def test_required_columns_present(cleaned_df):
     missing = set(cleaning.NON_LEAK_COLUMNS) - set(cleaned_df.columns)
     assert not missing, f"Missing required columns: {missing}"
@@ -43,6 +27,44 @@ def test_no_duplicate_runner_keys(cleaned_df):
     assert not duplicates.any(), "Duplicate (race_id, horse_id) pairs found"
 
 
+def test_duplicate_runner_key_detection():
+    unique = pd.DataFrame(
+        {"race_id": pd.array([1, 1, 2], dtype="Int64"), "horse_id": pd.array([10, 11, 10], dtype="Int64")}
+    )
+    assert not cleaning._has_duplicate_runner_keys(unique)
+
+    repeated = unique.assign(horse_id=pd.array([10, 10, 10], dtype="Int64"))
+    assert cleaning._has_duplicate_runner_keys(repeated)
+
+    with_missing = pd.DataFrame(
+        {"race_id": pd.array([1, None, None], dtype="Int64"), "horse_id": pd.array([10, 11, 11], dtype="Int64")}
+    )
+    assert cleaning._has_duplicate_runner_keys(with_missing)
+
+    extreme = pd.DataFrame(
+        {
+            "race_id": pd.array([1, 2], dtype="Int64"),
+            "horse_id": pd.array([-(2**63), 2**63 - 1], dtype="Int64"),
+        }
+    )
+    assert not cleaning._has_duplicate_runner_keys(extreme)
+    assert cleaning._has_duplicate_runner_keys(pd.concat([extreme, extreme]))
+
+
+def test_validate_schema_accepts_categorical_text_columns():
+    dtypes = {"object": "category", "int": "Int64", "float": "float64"}
+    raw = pd.DataFrame(
+        {
+            col: pd.Series(["x"] if kind == "object" else [1], dtype=dtypes[kind])
+            for col, kind in cleaning.SCHEMA.required_columns.items()
+        }
+    )
+    cleaning.validate_schema(raw)
+
+    with pytest.raises(ValueError, match="race_id must be integer"):
+        cleaning.validate_schema(raw.astype({"race_id": "category"}))
+
+
 def test_no_missing_critical_fields(cleaned_df):
     critical = ["race_id", "horse_id", "date", "race_time", "n_runners", "race_distance"]
     for col in critical: